@@ -1,10 +1,70 @@
+import functools
 import pandas as pd
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from data_loader import load_sales_data
 from llm_service import LLMService
 import numpy as np
 from datetime import datetime, timedelta
 
+# Polars runs aggregations multi-threaded over Arrow columns; fall back
+# to the pandas paths when it isn't installed
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Shared pool for LLM calls, so metric computation can overlap with the
+# network round-trip instead of running before it
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Activity weights: texts count once, calls twice
+_ACTIVITY_WEIGHTS = np.array([1] * 7 + [2] * 7, dtype=np.float32)
+
+# Numba compiles the batch activity-score kernel to native code; fall
+# back to the NumPy dot product when it isn't installed. The kernel is
+# deliberately serial: numba's parallel backend deadlocks at interpreter
+# shutdown when first invoked off the main thread, which is how the
+# lifespan handler (and TestClient) runs load_data, and the matrix is
+# far too small for threading to pay off anyway.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _activity_scores(mat):
+        out = np.empty(mat.shape[0], dtype=np.float32)
+        for i in range(mat.shape[0]):
+            s = 0.0
+            for j in range(7):
+                s += mat[i, j]
+            for j in range(7, 14):
+                s += 2.0 * mat[i, j]
+            out[i] = s
+        return out
+else:
+    def _activity_scores(mat):
+        return mat @ _ACTIVITY_WEIGHTS
+
+
+class AnalysisError(Exception):
+    """Raised when an analysis cannot be produced; carries an HTTP status."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cached_data() -> pd.DataFrame:
+    """Load the sales data once and share it across all service instances."""
+    return load_sales_data()
+
+
 class DataAnalysisService:
     def __init__(self):
         """Initialize the data analysis service."""
@@ -15,58 +75,129 @@ class DataAnalysisService:
     def load_data(self):
         """Load the sales performance data."""
         try:
-            self.data = load_sales_data()
+            self.data = _get_cached_data()
             print(f"Data loaded successfully: {len(self.data)} records")
         except Exception as e:
             print(f"Error loading data: {e}")
             self.data = pd.DataFrame()
+
+        # Map employee_id -> row positions once, so per-employee lookups
+        # are dict hits instead of full-column boolean scans
+        if not self.data.empty:
+            self._by_emp = self.data.groupby('employee_id', sort=False).indices
+        else:
+            self._by_emp = {}
+
+        # Pack daily text/call counts into one contiguous matrix so
+        # activity scores become a single dot product per row
+        self._text_cols = [f'{day}_text' for day in ['mon', 'tue', 'wed', 'thur', 'fri', 'sat', 'sun']]
+        self._call_cols = [f'{day}_call' for day in ['mon', 'tue', 'wed', 'thur', 'fri', 'sat', 'sun']]
+        if not self.data.empty:
+            self._activity_matrix = self.data[self._text_cols + self._call_cols].to_numpy(dtype=np.float32)
+        else:
+            self._activity_matrix = np.empty((0, 14), dtype=np.float32)
+        # Score every row up front so per-employee lookups are array reads
+        self._activity_scores = _activity_scores(self._activity_matrix)
+
+        # Parse dates and derive period buckets once, so trend analysis
+        # doesn't re-run pd.to_datetime (or copy the frame) per request
+        if not self.data.empty:
+            self.data['dated'] = pd.to_datetime(self.data['dated'])
+            self._month_period = self.data['dated'].dt.to_period('M')
+            self._quarter_period = self.data['dated'].dt.to_period('Q')
+        else:
+            self._month_period = pd.Series(dtype=object)
+            self._quarter_period = pd.Series(dtype=object)
+
+        # Mirror the frame into Polars once for multi-threaded aggregation
+        if pl is not None and not self.data.empty:
+            self._pl = pl.from_pandas(self.data)
+        else:
+            self._pl = None
+
+        # Pack the top-performer metric columns into one contiguous matrix
+        # so all four argmax scans happen in a single pass
+        self._top_metric_cols = [
+            'revenue_confirmed', 'lead_taken', 'applications', 'avg_close_rate_30_days'
+        ]
+        if not self.data.empty:
+            self._top_matrix = self.data[self._top_metric_cols].to_numpy(dtype=np.float32)
+            self._emp_names = self.data['employee_name'].to_numpy()
+            self._emp_ids = self.data['employee_id'].to_numpy()
+        else:
+            self._top_matrix = np.empty((0, len(self._top_metric_cols)), dtype=np.float32)
+            self._emp_names = np.empty(0, dtype=object)
+            self._emp_ids = np.empty(0, dtype=np.int64)
+
+        # Pipeline health for every row in one vectorized pass; individual
+        # lookups index into this instead of recomputing per employee
+        self._pipeline_health = self._calculate_pipeline_health_all()
     
-    def get_employee_data(self, employee_id: int) -> Optional[Dict[str, Any]]:
+    def get_employee_data(self, employee_id: int) -> Optional[pd.Series]:
         """
         Get employee data by ID.
-        
+
         Args:
             employee_id: Employee ID to search for
-            
+
         Returns:
-            Dictionary containing employee data or None if not found
+            Series containing employee data or None if not found. A Series
+            satisfies the same .get(key, default) interface as a dict, so
+            downstream readers don't pay a ~40-object dict conversion.
         """
         if self.data is None or self.data.empty:
             return None
-        
-        employee_records = self.data[self.data['employee_id'] == employee_id]
-        if employee_records.empty:
+
+        row_positions = self._by_emp.get(employee_id)
+        if row_positions is None:
             return None
-        
+
         # Get the most recent record for the employee
-        latest_record = employee_records.iloc[-1]
-        return latest_record.to_dict()
+        return self.data.iloc[row_positions[-1]]
     
-    def get_employee_performance_analysis(self, employee_id: int) -> Dict[str, Any]:
+    def get_employee_performance_analysis(self, employee_id: int,
+                                          llm_inline: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive performance analysis for a specific employee.
-        
+
         Args:
             employee_id: Employee ID to analyze
-            
+            llm_inline: Run the LLM call on the current thread instead of
+                the shared executor; batch callers that already fan out
+                across their own pool set this so concurrency isn't capped
+                by the executor's width
+
         Returns:
             Dictionary containing analysis results
         """
-        employee_data = self.get_employee_data(employee_id)
-        if not employee_data:
-            return {
-                "error": f"Employee with ID {employee_id} not found",
-                "employee_id": employee_id
-            }
-        
-        # Get historical data for the employee
-        historical_data = self.data[self.data['employee_id'] == employee_id]
-        
+        row_positions = self._by_emp.get(employee_id)
+        if row_positions is None:
+            raise AnalysisError(404, f"Employee with ID {employee_id} not found")
+
+        # Slice the employee's rows once and derive both the historical
+        # frame and the latest record from that single lookup; the Series
+        # is passed around directly instead of converting to a dict, and
+        # the row position travels as a separate argument so the shared
+        # frame's rows are never mutated
+        historical_data = self.data.iloc[row_positions]
+        employee_data = historical_data.iloc[-1]
+        row_idx = int(row_positions[-1])
+
+        # Kick off the LLM analysis first so the network round-trip
+        # overlaps with the metric computation below
+        llm_future = None
+        if not llm_inline:
+            llm_future = _EXECUTOR.submit(
+                self.llm_service.analyze_individual_performance, employee_data
+            )
+
         # Calculate additional metrics
-        performance_metrics = self._calculate_employee_metrics(employee_data, historical_data)
-        
-        # Generate LLM analysis
-        llm_analysis = self.llm_service.analyze_individual_performance(employee_data)
+        performance_metrics = self._calculate_employee_metrics(employee_data, historical_data, row_idx)
+
+        if llm_future is not None:
+            llm_analysis = llm_future.result()
+        else:
+            llm_analysis = self.llm_service.analyze_individual_performance(employee_data)
         
         return {
             "employee_id": employee_id,
@@ -74,9 +205,31 @@ class DataAnalysisService:
             "performance_metrics": performance_metrics,
             "llm_analysis": llm_analysis,
             "historical_records": len(historical_data),
-            "last_updated": employee_data.get('dated', 'Unknown')
+            "last_updated": str(employee_data.get('dated', 'Unknown'))
         }
     
+    def get_all_employee_analyses(self) -> List[Dict[str, Any]]:
+        """
+        Get performance analyses for every employee, in parallel.
+
+        The per-employee bottleneck is the Gemini network call, so running
+        analyses across a thread pool overlaps the RPCs instead of
+        serializing them (the GIL-bound pandas work is negligible).
+
+        Returns:
+            List of analysis dictionaries, one per unique employee
+        """
+        if self.data is None or self.data.empty:
+            return []
+
+        # llm_inline keeps each Gemini call on this pool's own threads;
+        # routing them through the shared 8-worker _EXECUTOR would cap
+        # the batch at 8 RPCs in flight regardless of the width here
+        analyze = functools.partial(self.get_employee_performance_analysis, llm_inline=True)
+        employee_ids = list(self._by_emp.keys())
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return list(executor.map(analyze, employee_ids))
+
     def get_team_performance_analysis(self) -> Dict[str, Any]:
         """
         Get comprehensive team performance analysis.
@@ -85,13 +238,17 @@ class DataAnalysisService:
             Dictionary containing team analysis results
         """
         if self.data is None or self.data.empty:
-            return {"error": "No data available for analysis"}
+            raise AnalysisError(500, "No data available for analysis")
         
+        # Kick off the LLM analysis so it runs while team metrics are computed
+        llm_future = _EXECUTOR.submit(
+            self.llm_service.analyze_team_performance, self.data
+        )
+
         # Calculate team metrics
         team_metrics = self._calculate_team_metrics()
-        
-        # Generate LLM analysis
-        llm_analysis = self.llm_service.analyze_team_performance(self.data)
+
+        llm_analysis = llm_future.result()
         
         return {
             "team_metrics": team_metrics,
@@ -112,13 +269,15 @@ class DataAnalysisService:
             Dictionary containing trend analysis
         """
         if self.data is None or self.data.empty:
-            return {"error": "No data available for analysis"}
+            raise AnalysisError(500, "No data available for analysis")
         
         # Calculate trend metrics
         trend_metrics = self._calculate_trend_metrics(time_period)
-        
-        # Generate LLM analysis
-        llm_analysis = self.llm_service.analyze_performance_trends(self.data, time_period)
+
+        # Generate LLM analysis from the already-computed metrics
+        llm_analysis = self.llm_service.analyze_performance_trends(
+            {"total_records": len(self.data), **trend_metrics}, time_period
+        )
         
         return {
             "time_period": time_period,
@@ -127,82 +286,151 @@ class DataAnalysisService:
             "analysis_date": datetime.now().isoformat()
         }
     
-    def _calculate_employee_metrics(self, employee_data: Dict[str, Any], historical_data: pd.DataFrame) -> Dict[str, Any]:
-        """Calculate additional metrics for an employee."""
+    def _calculate_employee_metrics(self, employee_data: pd.Series, historical_data: pd.DataFrame,
+                                    row_idx: Optional[int] = None) -> Dict[str, Any]:
+        """Calculate additional metrics for an employee.
+
+        row_idx is the record's position in self.data, used to index the
+        precomputed score/health arrays; without it the scalar fallbacks run.
+        """
+        # With a single record the averages are just that record's values
+        # and std() would be NaN, so skip the column reductions
+        if len(historical_data) <= 1:
+            avg_revenue = float(employee_data.get('revenue_confirmed', 0))
+            avg_leads = float(employee_data.get('lead_taken', 0))
+            consistency = 0.0
+        else:
+            avg_revenue = float(historical_data['revenue_confirmed'].mean())
+            avg_leads = float(historical_data['lead_taken'].mean())
+            consistency = float(
+                historical_data['revenue_confirmed'].std() / max(avg_revenue, 1)
+            )
+
+        # Coerce to native floats: the Series hands back numpy scalars
+        # (np.float32 after the dtype downcast), which the response
+        # serializer rejects
         metrics = {
             "current_performance": {
-                "conversion_rate": employee_data.get('apps_per_lead', 0),
-                "revenue_per_lead": employee_data.get('revenue_confirmed', 0) / max(employee_data.get('lead_taken', 1), 1),
-                "activity_score": self._calculate_activity_score(employee_data),
-                "pipeline_health": self._calculate_pipeline_health(employee_data)
+                "conversion_rate": float(employee_data.get('apps_per_lead', 0)),
+                "revenue_per_lead": float(employee_data.get('revenue_confirmed', 0) / max(employee_data.get('lead_taken', 1), 1)),
+                "activity_score": self._calculate_activity_score(employee_data, row_idx),
+                "pipeline_health": self._calculate_pipeline_health(employee_data, row_idx)
             },
             "historical_trends": {
                 "total_records": len(historical_data),
-                "avg_monthly_revenue": historical_data['revenue_confirmed'].mean(),
-                "avg_monthly_leads": historical_data['lead_taken'].mean(),
-                "performance_consistency": historical_data['revenue_confirmed'].std() / max(historical_data['revenue_confirmed'].mean(), 1)
+                "avg_monthly_revenue": avg_revenue,
+                "avg_monthly_leads": avg_leads,
+                "performance_consistency": consistency
             }
         }
         
         return metrics
     
+    def _team_aggregates(self) -> Dict[str, float]:
+        """Compute the flat team statistics in one pass over the frame."""
+        if self._pl is not None:
+            # Polars fuses these into one multi-threaded pass over the
+            # Arrow columns
+            return self._pl.select([
+                pl.col('employee_id').n_unique().alias('employees_nunique'),
+                pl.col('lead_taken').sum().alias('lead_taken_sum'),
+                pl.col('lead_taken').mean().alias('lead_taken_mean'),
+                pl.col('tours_booked').sum().alias('tours_booked_sum'),
+                pl.col('applications').sum().alias('applications_sum'),
+                pl.col('revenue_confirmed').sum().alias('revenue_confirmed_sum'),
+                pl.col('revenue_confirmed').mean().alias('revenue_confirmed_mean'),
+                pl.col('revenue_pending').sum().alias('revenue_pending_sum'),
+                pl.col('avg_close_rate_30_days').mean().alias('avg_close_rate_30_days_mean'),
+                pl.col('avg_deal_value_30_days').mean().alias('avg_deal_value_30_days_mean'),
+                pl.col('tours_per_lead').mean().alias('tours_per_lead_mean'),
+                pl.col('apps_per_tour').mean().alias('apps_per_tour_mean'),
+                pl.col('apps_per_lead').mean().alias('apps_per_lead_mean')
+            ]).to_dicts()[0]
+
+        agg = self.data.agg({
+            'employee_id': 'nunique',
+            'lead_taken': ['sum', 'mean'],
+            'tours_booked': 'sum',
+            'applications': 'sum',
+            'revenue_confirmed': ['sum', 'mean'],
+            'revenue_pending': 'sum',
+            'avg_close_rate_30_days': 'mean',
+            'avg_deal_value_30_days': 'mean',
+            'tours_per_lead': 'mean',
+            'apps_per_tour': 'mean',
+            'apps_per_lead': 'mean'
+        })
+        return {
+            'employees_nunique': agg.loc['nunique', 'employee_id'],
+            'lead_taken_sum': agg.loc['sum', 'lead_taken'],
+            'lead_taken_mean': agg.loc['mean', 'lead_taken'],
+            'tours_booked_sum': agg.loc['sum', 'tours_booked'],
+            'applications_sum': agg.loc['sum', 'applications'],
+            'revenue_confirmed_sum': agg.loc['sum', 'revenue_confirmed'],
+            'revenue_confirmed_mean': agg.loc['mean', 'revenue_confirmed'],
+            'revenue_pending_sum': agg.loc['sum', 'revenue_pending'],
+            'avg_close_rate_30_days_mean': agg.loc['mean', 'avg_close_rate_30_days'],
+            'avg_deal_value_30_days_mean': agg.loc['mean', 'avg_deal_value_30_days'],
+            'tours_per_lead_mean': agg.loc['mean', 'tours_per_lead'],
+            'apps_per_tour_mean': agg.loc['mean', 'apps_per_tour'],
+            'apps_per_lead_mean': agg.loc['mean', 'apps_per_lead']
+        }
+
     def _calculate_team_metrics(self) -> Dict[str, Any]:
         """Calculate comprehensive team metrics."""
+        stats = self._team_aggregates()
+
         metrics = {
             "overview": {
-                "total_employees": self.data['employee_id'].nunique(),
-                "total_leads": int(self.data['lead_taken'].sum()),
-                "total_tours": int(self.data['tours_booked'].sum()),
-                "total_applications": int(self.data['applications'].sum()),
-                "total_confirmed_revenue": int(self.data['revenue_confirmed'].sum()),
-                "total_pending_revenue": int(self.data['revenue_pending'].sum())
+                "total_employees": int(stats['employees_nunique']),
+                "total_leads": int(stats['lead_taken_sum']),
+                "total_tours": int(stats['tours_booked_sum']),
+                "total_applications": int(stats['applications_sum']),
+                "total_confirmed_revenue": int(stats['revenue_confirmed_sum']),
+                "total_pending_revenue": int(stats['revenue_pending_sum'])
             },
             "averages": {
-                "avg_leads_per_employee": float(self.data['lead_taken'].mean()),
-                "avg_revenue_per_employee": float(self.data['revenue_confirmed'].mean()),
-                "avg_close_rate": float(self.data['avg_close_rate_30_days'].mean()),
-                "avg_deal_value": float(self.data['avg_deal_value_30_days'].mean())
+                "avg_leads_per_employee": float(stats['lead_taken_mean']),
+                "avg_revenue_per_employee": float(stats['revenue_confirmed_mean']),
+                "avg_close_rate": float(stats['avg_close_rate_30_days_mean']),
+                "avg_deal_value": float(stats['avg_deal_value_30_days_mean'])
             },
             "conversion_metrics": {
-                "team_tours_per_lead": float(self.data['tours_per_lead'].mean()),
-                "team_apps_per_tour": float(self.data['apps_per_tour'].mean()),
-                "team_apps_per_lead": float(self.data['apps_per_lead'].mean())
+                "team_tours_per_lead": float(stats['tours_per_lead_mean']),
+                "team_apps_per_tour": float(stats['apps_per_tour_mean']),
+                "team_apps_per_lead": float(stats['apps_per_lead_mean'])
             },
-            "top_performers": {
-                "highest_revenue": self._get_top_performer('revenue_confirmed'),
-                "highest_leads": self._get_top_performer('lead_taken'),
-                "highest_applications": self._get_top_performer('applications'),
-                "highest_close_rate": self._get_top_performer('avg_close_rate_30_days')
-            }
+            "top_performers": self._top_performers()
         }
         
         return metrics
     
     def _calculate_trend_metrics(self, time_period: str) -> Dict[str, Any]:
         """Calculate trend-based metrics."""
-        # Convert date columns
-        data_copy = self.data.copy()
-        data_copy['dated'] = pd.to_datetime(data_copy['dated'])
-        
-        # Calculate time-based groupings
+        # Period buckets are precomputed at load time; one fused groupby
+        # replaces the four separate sum/mean passes
         if time_period == "monthly":
-            grouped = data_copy.groupby(data_copy['dated'].dt.to_period('M'))
+            period_series = self._month_period
         else:  # quarterly
-            grouped = data_copy.groupby(data_copy['dated'].dt.to_period('Q'))
-        
+            period_series = self._quarter_period
+
+        grouped = self.data.groupby(period_series, sort=True).agg({
+            'revenue_confirmed': 'sum',
+            'lead_taken': 'sum',
+            'applications': 'sum',
+            'avg_close_rate_30_days': 'mean'
+        })
+
+        # Convert Period objects to strings for JSON serialization
         trends = {
-            "revenue_trend": grouped['revenue_confirmed'].sum().to_dict(),
-            "lead_trend": grouped['lead_taken'].sum().to_dict(),
-            "application_trend": grouped['applications'].sum().to_dict(),
-            "close_rate_trend": grouped['avg_close_rate_30_days'].mean().to_dict()
+            "revenue_trend": {str(k): v for k, v in grouped['revenue_confirmed'].items()},
+            "lead_trend": {str(k): v for k, v in grouped['lead_taken'].items()},
+            "application_trend": {str(k): v for k, v in grouped['applications'].items()},
+            "close_rate_trend": {str(k): v for k, v in grouped['avg_close_rate_30_days'].items()}
         }
-        
-        # Convert Period objects to strings for JSON serialization
-        for key, value in trends.items():
-            trends[key] = {str(k): v for k, v in value.items()}
-        
+
         # Calculate growth rates
-        revenue_values = list(grouped['revenue_confirmed'].sum().values)
+        revenue_values = list(grouped['revenue_confirmed'].values)
         if len(revenue_values) > 1:
             recent_growth = ((revenue_values[-1] - revenue_values[-2]) / max(revenue_values[-2], 1)) * 100
         else:
@@ -224,43 +452,76 @@ class DataAnalysisService:
         
         return metrics
     
-    def _calculate_activity_score(self, employee_data: Dict[str, Any]) -> float:
+    def _calculate_activity_score(self, employee_data: pd.Series, row_idx: Optional[int] = None) -> float:
         """Calculate employee activity score based on daily activities."""
+        if row_idx is not None:
+            # Scores for all rows are precomputed by the batch kernel
+            return float(self._activity_scores[row_idx])
+
+        # Fallback for data not backed by a loaded row
         total_texts = sum([
-            employee_data.get(f'{day}_text', 0) 
-            for day in ['mon', 'tue', 'wed', 'thur', 'fri', 'sat', 'sun']
+            employee_data.get(col, 0) for col in self._text_cols
         ])
         total_calls = sum([
-            employee_data.get(f'{day}_call', 0) 
-            for day in ['mon', 'tue', 'wed', 'thur', 'fri', 'sat', 'sun']
+            employee_data.get(col, 0) for col in self._call_cols
         ])
-        
-        # Weighted score (calls are worth more than texts)
-        activity_score = (total_texts * 1) + (total_calls * 2)
-        return float(activity_score)
+        return float((total_texts * 1) + (total_calls * 2))
     
-    def _calculate_pipeline_health(self, employee_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_pipeline_health_all(self) -> pd.DataFrame:
+        """Calculate pipeline health for every row in one vectorized pass."""
+        columns = ['pipeline_tours', 'scheduled_tours', 'cancelled_rate', 'pending_revenue']
+        if self.data is None or self.data.empty:
+            return pd.DataFrame(columns=columns)
+
+        denom = (self.data['tours_in_pipeline'] + self.data['tours_scheduled']).clip(lower=1)
+        return pd.DataFrame({
+            'pipeline_tours': self.data['tours_in_pipeline'],
+            'scheduled_tours': self.data['tours_scheduled'],
+            'cancelled_rate': self.data['tours_cancelled'] / denom,
+            'pending_revenue': self.data['revenue_pending']
+        })
+
+    def _calculate_pipeline_health(self, employee_data: pd.Series, row_idx: Optional[int] = None) -> Dict[str, Any]:
         """Calculate pipeline health metrics."""
+        if row_idx is not None:
+            row = self._pipeline_health.iloc[row_idx]
+            return {
+                "pipeline_tours": int(row['pipeline_tours']),
+                "scheduled_tours": int(row['scheduled_tours']),
+                "cancelled_rate": float(row['cancelled_rate']),
+                "pending_revenue": int(row['pending_revenue'])
+            }
+
+        # Fallback for data not backed by a loaded row; cast to native
+        # types since Series values are numpy scalars
         total_tours = employee_data.get('tours_in_pipeline', 0) + employee_data.get('tours_scheduled', 0)
         cancelled_rate = employee_data.get('tours_cancelled', 0) / max(total_tours, 1)
-        
+
         return {
-            "pipeline_tours": employee_data.get('tours_in_pipeline', 0),
-            "scheduled_tours": employee_data.get('tours_scheduled', 0),
+            "pipeline_tours": int(employee_data.get('tours_in_pipeline', 0)),
+            "scheduled_tours": int(employee_data.get('tours_scheduled', 0)),
             "cancelled_rate": float(cancelled_rate),
-            "pending_revenue": employee_data.get('revenue_pending', 0)
+            "pending_revenue": int(employee_data.get('revenue_pending', 0))
         }
     
-    def _get_top_performer(self, metric: str) -> Dict[str, Any]:
-        """Get top performer for a specific metric."""
-        if self.data is None or self.data.empty:
-            return {"name": "Unknown", "value": 0, "employee_id": 0}
-        
-        top_performer = self.data.loc[self.data[metric].idxmax()]
+    def _top_performers(self) -> Dict[str, Dict[str, Any]]:
+        """Get top performers for all headline metrics in one argmax pass."""
+        labels = ["highest_revenue", "highest_leads", "highest_applications", "highest_close_rate"]
+        if self._top_matrix.size == 0:
+            return {
+                label: {"name": "Unknown", "value": 0, "employee_id": 0}
+                for label in labels
+            }
+
+        # One SIMD walk over the packed matrix instead of four idxmax scans
+        rows = self._top_matrix.argmax(axis=0)
         return {
-            "name": top_performer.get('employee_name', 'Unknown'),
-            "value": float(top_performer[metric]),
-            "employee_id": int(top_performer['employee_id'])
+            label: {
+                "name": self._emp_names[row],
+                "value": float(self.data[metric].iloc[row]),
+                "employee_id": int(self._emp_ids[row])
+            }
+            for label, metric, row in zip(labels, self._top_metric_cols, rows)
         }
     
  
\ No newline at end of file
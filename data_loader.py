@@ -1,6 +1,45 @@
 import pandas as pd
 import os
 
+# Explicit narrow dtypes for the sales CSV. Counts fit in int16/int32 and
+# ratio columns in float32, so aggregations scan half (or a quarter of)
+# the bytes they would with the default int64/float64 inference.
+SALES_DTYPES = {
+    'employee_id': 'int32',
+    'lead_taken': 'int32',
+    'tours_booked': 'int32',
+    'applications': 'int32',
+    'tours_per_lead': 'float32',
+    'apps_per_tour': 'float32',
+    'apps_per_lead': 'float32',
+    'revenue_confirmed': 'int64',
+    'revenue_pending': 'int64',
+    'revenue_runrate': 'int64',
+    'estimated_revenue': 'int64',
+    'tours_in_pipeline': 'int16',
+    'avg_deal_value_30_days': 'float32',
+    'avg_close_rate_30_days': 'float32',
+    'tours': 'int16',
+    'tours_runrate': 'int16',
+    'tours_scheduled': 'int16',
+    'tours_pending': 'int16',
+    'tours_cancelled': 'int16',
+    'mon_text': 'int16',
+    'tue_text': 'int16',
+    'wed_text': 'int16',
+    'thur_text': 'int16',
+    'fri_text': 'int16',
+    'sat_text': 'int16',
+    'sun_text': 'int16',
+    'mon_call': 'int16',
+    'tue_call': 'int16',
+    'wed_call': 'int16',
+    'thur_call': 'int16',
+    'fri_call': 'int16',
+    'sat_call': 'int16',
+    'sun_call': 'int16',
+}
+
 
 def load_csv(file_path):
     """
@@ -21,9 +60,13 @@ def load_csv(file_path):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        # Load the CSV file
-        df = pd.read_csv(file_path)
-        
+        # Load the CSV file; pyarrow's reader parses columns in parallel,
+        # so prefer it and fall back to the default C engine if unavailable
+        try:
+            df = pd.read_csv(file_path, engine="pyarrow")
+        except (ImportError, ValueError):
+            df = pd.read_csv(file_path)
+
         print(f"Successfully loaded CSV file: {file_path}")
         print(f"Shape: {df.shape}")
         print(f"Columns: {list(df.columns)}")
@@ -71,12 +114,49 @@ def load_csv_with_options(file_path, **kwargs):
 def load_sales_data():
     """
     Load the sales performance data CSV file from the current directory.
-    
+
+    Uses an Arrow IPC copy of the CSV as a cache: the binary columnar file
+    skips CSV tokenization and type inference, and it is opened through a
+    memory map so the OS pages it in on demand and multiple worker
+    processes share one copy of the data in the page cache. The cache is
+    rebuilt whenever the CSV is newer.
+
     Returns:
         pd.DataFrame: The loaded sales performance dataframe
     """
     file_path = "sales_performance_data.csv"
-    return load_csv(file_path)
+    arrow_path = "sales_performance_data.arrow"
+
+    # Warm path: memory-map the Arrow cache if it's up to date with the CSV
+    if os.path.exists(arrow_path) and os.path.exists(file_path):
+        if os.path.getmtime(arrow_path) >= os.path.getmtime(file_path):
+            try:
+                import pyarrow as pa
+                with pa.memory_map(arrow_path) as source:
+                    df = pa.ipc.open_file(source).read_all().to_pandas()
+                print(f"Loaded memory-mapped Arrow cache: {arrow_path}")
+                return df
+            except Exception as e:
+                print(f"Error reading Arrow cache, falling back to CSV: {e}")
+
+    # Cold path: parse the CSV with narrow dtypes, then write the cache
+    # for next time (the dtypes survive the Arrow round-trip)
+    try:
+        df = load_csv_with_options(file_path, dtype=SALES_DTYPES, engine="pyarrow")
+    except (ImportError, ValueError, TypeError) as e:
+        print(f"Warning: dtype mapping rejected ({e}), re-reading with inference")
+        df = load_csv(file_path)
+    try:
+        import pyarrow as pa
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(arrow_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        print(f"Wrote Arrow cache: {arrow_path}")
+    except Exception as e:
+        print(f"Warning: could not write Arrow cache: {e}")
+
+    return df
 
 
 if __name__ == "__main__":
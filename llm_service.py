@@ -1,69 +1,76 @@
+import hashlib
 import os
+import threading
 import pandas as pd
 import google.generativeai as genai
-from datetime import datetime, timedelta
-from typing import Dict, Any
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Dict, Any, Iterator
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-class LLMService:
-    def __init__(self):
-        """Initialize the LLM service with Gemini AI."""
-        api_key = os.getenv('GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
-    
-    def analyze_individual_performance(self, employee_data: Dict[str, Any]) -> str:
-        """
-        Analyze individual sales representative performance using LLM.
-        
-        Args:
-            employee_data: Dictionary containing employee performance metrics
-            
-        Returns:
-            str: LLM-generated analysis and recommendations
-        """
-        prompt = f"""
+# Upper bound on cached Gemini responses per service instance
+_RESPONSE_CACHE_SIZE = 256
+
+# Prompt scaffolding is static per analysis type, so the templates are
+# built once at import time; per-call work is reduced to one batched
+# field extraction plus a single .format()
+_INDIV_FIELDS = (
+    'employee_name', 'employee_id',
+    'lead_taken', 'tours_booked', 'applications',
+    'tours_per_lead', 'apps_per_tour', 'apps_per_lead',
+    'revenue_confirmed', 'revenue_pending', 'revenue_runrate',
+    'estimated_revenue', 'avg_deal_value_30_days', 'avg_close_rate_30_days',
+    'tours_in_pipeline', 'tours_scheduled', 'tours_pending', 'tours_cancelled',
+    'mon_text', 'mon_call', 'tue_text', 'tue_call', 'wed_text', 'wed_call',
+    'thur_text', 'thur_call', 'fri_text', 'fri_call',
+    'sat_text', 'sat_call', 'sun_text', 'sun_call'
+)
+
+_INDIV_DEFAULTS = {field: 0 for field in _INDIV_FIELDS}
+_INDIV_DEFAULTS['employee_name'] = 'Unknown'
+_INDIV_DEFAULTS['employee_id'] = 'Unknown'
+
+_INDIV_GETTER = itemgetter(*_INDIV_FIELDS)
+
+_INDIV_TEMPLATE = """
         You are a sales performance analyst. Analyze the following sales representative's performance data and provide detailed insights:
 
-        Employee: {employee_data.get('employee_name', 'Unknown')}
-        Employee ID: {employee_data.get('employee_id', 'Unknown')}
-        
+        Employee: {}
+        Employee ID: {}
+
         Performance Metrics:
-        - Leads Taken: {employee_data.get('lead_taken', 0)}
-        - Tours Booked: {employee_data.get('tours_booked', 0)}
-        - Applications: {employee_data.get('applications', 0)}
-        - Tours per Lead: {employee_data.get('tours_per_lead', 0):.2f}
-        - Apps per Tour: {employee_data.get('apps_per_tour', 0):.2f}
-        - Apps per Lead: {employee_data.get('apps_per_lead', 0):.2f}
-        
+        - Leads Taken: {}
+        - Tours Booked: {}
+        - Applications: {}
+        - Tours per Lead: {:.2f}
+        - Apps per Tour: {:.2f}
+        - Apps per Lead: {:.2f}
+
         Revenue Metrics:
-        - Revenue Confirmed: ${employee_data.get('revenue_confirmed', 0):,}
-        - Revenue Pending: ${employee_data.get('revenue_pending', 0):,}
-        - Revenue Runrate: ${employee_data.get('revenue_runrate', 0):,}
-        - Estimated Revenue: ${employee_data.get('estimated_revenue', 0):,}
-        - Average Deal Value (30 days): ${employee_data.get('avg_deal_value_30_days', 0):,}
-        - Average Close Rate (30 days): {employee_data.get('avg_close_rate_30_days', 0):.2f}%
-        
+        - Revenue Confirmed: ${:,}
+        - Revenue Pending: ${:,}
+        - Revenue Runrate: ${:,}
+        - Estimated Revenue: ${:,}
+        - Average Deal Value (30 days): ${:,}
+        - Average Close Rate (30 days): {:.2f}%
+
         Activity Metrics:
-        - Tours in Pipeline: {employee_data.get('tours_in_pipeline', 0)}
-        - Tours Scheduled: {employee_data.get('tours_scheduled', 0)}
-        - Tours Pending: {employee_data.get('tours_pending', 0)}
-        - Tours Cancelled: {employee_data.get('tours_cancelled', 0)}
-        
+        - Tours in Pipeline: {}
+        - Tours Scheduled: {}
+        - Tours Pending: {}
+        - Tours Cancelled: {}
+
         Daily Activity (Texts/Calls):
-        - Monday: {employee_data.get('mon_text', 0)} texts, {employee_data.get('mon_call', 0)} calls
-        - Tuesday: {employee_data.get('tue_text', 0)} texts, {employee_data.get('tue_call', 0)} calls
-        - Wednesday: {employee_data.get('wed_text', 0)} texts, {employee_data.get('wed_call', 0)} calls
-        - Thursday: {employee_data.get('thur_text', 0)} texts, {employee_data.get('thur_call', 0)} calls
-        - Friday: {employee_data.get('fri_text', 0)} texts, {employee_data.get('fri_call', 0)} calls
-        - Saturday: {employee_data.get('sat_text', 0)} texts, {employee_data.get('sat_call', 0)} calls
-        - Sunday: {employee_data.get('sun_text', 0)} texts, {employee_data.get('sun_call', 0)} calls
+        - Monday: {} texts, {} calls
+        - Tuesday: {} texts, {} calls
+        - Wednesday: {} texts, {} calls
+        - Thursday: {} texts, {} calls
+        - Friday: {} texts, {} calls
+        - Saturday: {} texts, {} calls
+        - Sunday: {} texts, {} calls
 
         Please provide:
         1. Overall performance assessment
@@ -74,10 +81,110 @@ class LLMService:
 
         Format your response in a clear, professional manner with bullet points and sections.
         """
+
+_TEAM_TEMPLATE = """
+        You are a sales team performance analyst. Analyze the following sales team's overall performance:
+
+        Team Overview:
+        - Total Team Members: {}
+        - Total Leads Taken: {:,}
+        - Total Tours Booked: {:,}
+        - Total Applications: {:,}
+        - Total Confirmed Revenue: ${:,}
+        - Total Pending Revenue: ${:,}
+        - Average Team Close Rate: {:.2f}%
+
+        Performance Distribution:
+        - Highest Revenue Generator: {} (${:,})
+        - Highest Lead Generator: {} ({} leads)
+        - Average Revenue per Rep: ${:,.0f}
+        - Average Leads per Rep: {:.1f}
+        - Average Apps per Rep: {:.1f}
+
+        Conversion Metrics:
+        - Team Tours per Lead: {:.2f}
+        - Team Apps per Tour: {:.2f}
+        - Team Apps per Lead: {:.2f}
+
+        Please provide:
+        1. Overall team performance assessment
+        2. Key team strengths and challenges
+        3. Performance distribution analysis (top performers vs. underperformers)
+        4. Team-wide improvement recommendations
+        5. Suggested team goals and KPIs for the next quarter
+        6. Resource allocation recommendations
+
+        Format your response professionally with clear sections and actionable insights.
+        """
+
+class LLMService:
+    def __init__(self):
+        """Initialize the LLM service with Gemini AI."""
+        api_key = os.getenv('GEMINI_API_KEY')
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables")
         
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel('gemini-1.5-flash')
+
+        # Responses cached per instance, keyed by prompt digest only, so
+        # full prompts aren't retained as keys and the cache dies with
+        # the service. The lock guards eviction: _generate runs on the
+        # analysis thread pool.
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+    def _generate(self, prompt: str) -> str:
+        """
+        Generate content for a prompt, caching responses by content hash.
+
+        The Gemini RPC is the dominant latency in this service, so repeat
+        queries for an identical prompt (same employee/team snapshot)
+        return the cached text instead of issuing a new network call.
+        """
+        key = hashlib.blake2b(prompt.encode()).hexdigest()
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        text = "".join(self._stream_generate(prompt))
+        with self._response_cache_lock:
+            while len(self._response_cache) >= _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+            self._response_cache[key] = text
+        return text
+
+    def _stream_generate(self, prompt: str) -> Iterator[str]:
+        """
+        Stream generated text chunk by chunk.
+
+        Streaming keeps first-token latency low: consumers that can render
+        partial output (e.g. a StreamingResponse) display text while
+        generation continues, while existing callers join the chunks into
+        the same full string as before.
+        """
+        for chunk in self.model.generate_content(prompt, stream=True):
+            yield chunk.text
+
+    def analyze_individual_performance(self, employee_data: pd.Series) -> str:
+        """
+        Analyze individual sales representative performance using LLM.
+
+        Args:
+            employee_data: Series of employee performance metrics (any
+                mapping with the same keys also works)
+
+        Returns:
+            str: LLM-generated analysis and recommendations
+        """
+        # Batch-extract the fields (defaults fill any missing keys) and
+        # pour them into the precompiled template
+        values = _INDIV_GETTER({**_INDIV_DEFAULTS, **employee_data})
+        prompt = _INDIV_TEMPLATE.format(*values)
+
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            return self._generate(prompt)
         except Exception as e:
             return f"Error generating analysis: {str(e)}"
     
@@ -103,95 +210,67 @@ class LLMService:
         top_revenue_performer = team_data.loc[team_data['revenue_confirmed'].idxmax()]
         top_lead_performer = team_data.loc[team_data['lead_taken'].idxmax()]
         
-        prompt = f"""
-        You are a sales team performance analyst. Analyze the following sales team's overall performance:
+        prompt = _TEAM_TEMPLATE.format(
+            len(team_data),
+            total_leads,
+            total_tours,
+            total_applications,
+            total_confirmed_revenue,
+            total_pending_revenue,
+            avg_close_rate,
+            top_revenue_performer['employee_name'],
+            top_revenue_performer['revenue_confirmed'],
+            top_lead_performer['employee_name'],
+            top_lead_performer['lead_taken'],
+            team_data['revenue_confirmed'].mean(),
+            team_data['lead_taken'].mean(),
+            team_data['applications'].mean(),
+            team_data['tours_per_lead'].mean(),
+            team_data['apps_per_tour'].mean(),
+            team_data['apps_per_lead'].mean()
+        )
 
-        Team Overview:
-        - Total Team Members: {len(team_data)}
-        - Total Leads Taken: {total_leads:,}
-        - Total Tours Booked: {total_tours:,}
-        - Total Applications: {total_applications:,}
-        - Total Confirmed Revenue: ${total_confirmed_revenue:,}
-        - Total Pending Revenue: ${total_pending_revenue:,}
-        - Average Team Close Rate: {avg_close_rate:.2f}%
-
-        Performance Distribution:
-        - Highest Revenue Generator: {top_revenue_performer['employee_name']} (${top_revenue_performer['revenue_confirmed']:,})
-        - Highest Lead Generator: {top_lead_performer['employee_name']} ({top_lead_performer['lead_taken']} leads)
-        - Average Revenue per Rep: ${team_data['revenue_confirmed'].mean():,.0f}
-        - Average Leads per Rep: {team_data['lead_taken'].mean():.1f}
-        - Average Apps per Rep: {team_data['applications'].mean():.1f}
-
-        Conversion Metrics:
-        - Team Tours per Lead: {team_data['tours_per_lead'].mean():.2f}
-        - Team Apps per Tour: {team_data['apps_per_tour'].mean():.2f}
-        - Team Apps per Lead: {team_data['apps_per_lead'].mean():.2f}
-
-        Please provide:
-        1. Overall team performance assessment
-        2. Key team strengths and challenges
-        3. Performance distribution analysis (top performers vs. underperformers)
-        4. Team-wide improvement recommendations
-        5. Suggested team goals and KPIs for the next quarter
-        6. Resource allocation recommendations
-
-        Format your response professionally with clear sections and actionable insights.
-        """
-        
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            return self._generate(prompt)
         except Exception as e:
             return f"Error generating team analysis: {str(e)}"
     
-    def analyze_performance_trends(self, team_data: pd.DataFrame, time_period: str = "monthly") -> str:
+    def analyze_performance_trends(self, precomputed: Dict[str, Any], time_period: str = "monthly") -> str:
         """
         Analyze sales performance trends and provide forecasting.
-        
+
         Args:
-            team_data: DataFrame containing performance data
+            precomputed: Trend metrics already computed by the caller
+                (growth_metrics, pipeline_metrics, per-period trends)
             time_period: Time period for analysis (monthly, quarterly)
-            
+
         Returns:
             str: LLM-generated trend analysis and forecasting
         """
-        # Convert date columns
-        team_data['created'] = pd.to_datetime(team_data['created'])
-        team_data['dated'] = pd.to_datetime(team_data['dated'])
-        
-        # Calculate time-based metrics
-        date_range = team_data['dated'].max() - team_data['dated'].min()
-        latest_month_data = team_data[team_data['dated'] >= team_data['dated'].max() - timedelta(days=30)]
-        
-        # Revenue trend analysis
-        revenue_trend = team_data.groupby(team_data['dated'].dt.to_period('M'))['revenue_confirmed'].sum()
-        lead_trend = team_data.groupby(team_data['dated'].dt.to_period('M'))['lead_taken'].sum()
-        
+        growth = precomputed.get('growth_metrics', {})
+        pipeline = precomputed.get('pipeline_metrics', {})
+        trends = precomputed.get('trends', {})
+
         prompt = f"""
         You are a sales forecasting analyst. Analyze the following sales performance trends and provide forecasting insights:
 
         Data Overview:
-        - Date Range: {date_range.days} days
         - Analysis Period: {time_period}
-        - Total Records: {len(team_data)}
-        - Latest Month Performance: {len(latest_month_data)} records
-
-        Current Performance Metrics:
-        - Current Month Revenue: ${latest_month_data['revenue_confirmed'].sum():,}
-        - Current Month Leads: {latest_month_data['lead_taken'].sum():,}
-        - Current Month Applications: {latest_month_data['applications'].sum():,}
-        - Current Month Average Close Rate: {latest_month_data['avg_close_rate_30_days'].mean():.2f}%
+        - Total Records: {precomputed.get('total_records', 0)}
+        - Periods Analyzed: {growth.get('total_periods', 0)}
 
         Trend Indicators:
-        - Revenue Runrate: ${team_data['revenue_runrate'].mean():,.0f}
-        - Tours in Pipeline: {team_data['tours_in_pipeline'].sum():,}
-        - Pending Revenue: ${team_data['revenue_pending'].sum():,}
-        - Average Deal Value Trend: ${team_data['avg_deal_value_30_days'].mean():,.0f}
+        - Recent Revenue Growth: {growth.get('recent_revenue_growth', 0):.2f}%
+        - Average Revenue per Period: ${growth.get('avg_period_revenue', 0):,.0f}
+        - Tours in Pipeline: {pipeline.get('total_pipeline_tours', 0):,}
+        - Pending Revenue: ${pipeline.get('total_pending_revenue', 0):,}
+        - Average Deal Value: ${pipeline.get('avg_deal_value', 0):,.0f}
 
-        Performance Efficiency:
-        - Average Tours per Lead: {team_data['tours_per_lead'].mean():.2f}
-        - Average Apps per Tour: {team_data['apps_per_tour'].mean():.2f}
-        - Team Activity Level: {team_data[['mon_text', 'tue_text', 'wed_text', 'thur_text', 'fri_text', 'sat_text', 'sun_text']].sum().sum()} total texts
+        Per-Period Trends:
+        - Revenue by Period: {trends.get('revenue_trend', {})}
+        - Leads by Period: {trends.get('lead_trend', {})}
+        - Applications by Period: {trends.get('application_trend', {})}
+        - Close Rate by Period: {trends.get('close_rate_trend', {})}
 
         Please provide:
         1. Trend analysis for {time_period} performance
@@ -206,8 +285,7 @@ class LLMService:
         """
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            return self._generate(prompt)
         except Exception as e:
             return f"Error generating trend analysis: {str(e)}"
     
@@ -1,42 +1,82 @@
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Dict, Any
+import orjson
 import uvicorn
-from data_analysis_service import DataAnalysisService
+from cachetools import TTLCache
+from data_analysis_service import AnalysisError, DataAnalysisService
 import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from enum import Enum
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+# Data analysis service, initialized by the lifespan handler
+analysis_service = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the analysis service when the server starts.
+
+    Running this in the lifespan instead of at import time means reload
+    cycles and worker forks don't pay the data-load cost just to import
+    the module; under prefork servers the parent's loaded pages are
+    shared copy-on-write by the children.
+    """
+    global analysis_service
+    try:
+        analysis_service = DataAnalysisService()
+        logger.info("Data analysis service initialized successfully")
+    except Exception as e:
+        logger.error("Failed to initialize data analysis service: %s", e)
+        analysis_service = None
+    yield
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Sales Performance Analysis API",
     description="A comprehensive API for analyzing sales team performance using AI-powered insights",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add CORS middleware
+# Add CORS middleware. Explicit origins/methods/headers let Starlette
+# precompute the response headers instead of expanding wildcards per
+# request (and only GET endpoints exist here anyway).
+allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure as needed for production
+    allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET"],
+    allow_headers=["authorization", "content-type"],
 )
 
-# Initialize data analysis service
-try:
-    analysis_service = DataAnalysisService()
-    logger.info("Data analysis service initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize data analysis service: {e}")
-    analysis_service = None
+# Compress large responses; the LLM analysis text is highly compressible.
+# minimum_size leaves small payloads (e.g. the root status) untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Short-lived response caches: repeat hits return the stored result
+# instead of re-running the pandas + LLM pipeline. The underlying data
+# only changes on restart, so the TTLs just bound staleness of LLM text.
+# cachetools is not thread-safe and the sync handlers run on FastAPI's
+# thread pool, so all cache access goes through one lock.
+_cache_lock = threading.Lock()
+_rep_cache = TTLCache(maxsize=4096, ttl=120)
+_team_cache = TTLCache(maxsize=1, ttl=300)
+_trends_cache = TTLCache(maxsize=2, ttl=300)
 
 # Pydantic models
 class EmployeePerformanceResponse(BaseModel):
@@ -60,18 +100,19 @@ class TrendAnalysisResponse(BaseModel):
     llm_analysis: str
     analysis_date: str
 
+class Period(str, Enum):
+    monthly = "monthly"
+    quarterly = "quarterly"
 
 
-class ErrorResponse(BaseModel):
-    error: str
-    detail: Optional[str] = None
-    timestamp: str
+# Root endpoint payload never changes, so serialize it once at import
+# time; liveness checks then skip dict construction and JSON encoding
+_ROOT_BYTES = orjson.dumps({"message": "Sales Performance Analysis API", "status": "running"})
 
-# Root endpoint
 @app.get("/")
 async def root():
     """API status."""
-    return {"message": "Sales Performance Analysis API", "status": "running"}
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 
 
@@ -79,7 +120,7 @@ async def root():
 @app.get("/api/rep_performance", 
          response_model=EmployeePerformanceResponse,
          summary="Get Individual Sales Rep Performance Analysis")
-async def get_rep_performance(
+def get_rep_performance(
     rep_id: int = Query(..., description="Unique identifier for the sales representative", ge=1)
 ):
     """
@@ -92,25 +133,29 @@ async def get_rep_performance(
         raise HTTPException(status_code=503, detail="Data analysis service not available")
     
     try:
-        logger.info(f"Analyzing performance for employee ID: {rep_id}")
+        with _cache_lock:
+            cached = _rep_cache.get(rep_id)
+        if cached is not None:
+            return cached
+
+        logger.info("Analyzing performance for employee ID: %s", rep_id)
         result = analysis_service.get_employee_performance_analysis(rep_id)
-        
-        if "error" in result:
-            raise HTTPException(status_code=404, detail=result["error"])
-        
+
+        with _cache_lock:
+            _rep_cache[rep_id] = result
         return result
         
-    except HTTPException:
+    except (AnalysisError, HTTPException):
         raise
     except Exception as e:
-        logger.error(f"Error analyzing rep performance: {e}")
+        logger.error("Error analyzing rep performance: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 # 2. Overall Sales Team Performance Summary
 @app.get("/api/team_performance", 
          response_model=TeamPerformanceResponse,
          summary="Get Overall Sales Team Performance Summary")
-async def get_team_performance():
+def get_team_performance():
     """
     Provides a comprehensive summary of the sales team's overall performance.
     
@@ -121,27 +166,32 @@ async def get_team_performance():
         raise HTTPException(status_code=503, detail="Data analysis service not available")
     
     try:
+        with _cache_lock:
+            cached = _team_cache.get('team')
+        if cached is not None:
+            return cached
+
         logger.info("Analyzing team performance")
         result = analysis_service.get_team_performance_analysis()
-        
-        if "error" in result:
-            raise HTTPException(status_code=500, detail=result["error"])
-        
+
+        with _cache_lock:
+            _team_cache['team'] = result
         return result
         
+    except AnalysisError:
+        raise
     except Exception as e:
-        logger.error(f"Error analyzing team performance: {e}")
+        logger.error("Error analyzing team performance: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 # 3. Sales Performance Trends and Forecasting
 @app.get("/api/performance_trends", 
          response_model=TrendAnalysisResponse,
          summary="Get Sales Performance Trends and Forecasting")
-async def get_performance_trends(
-    time_period: str = Query(
-        "monthly", 
-        description="Time period for analysis (monthly, quarterly)", 
-        regex="^(monthly|quarterly)$"
+def get_performance_trends(
+    time_period: Period = Query(
+        Period.monthly,
+        description="Time period for analysis (monthly, quarterly)"
     )
 ):
     """
@@ -154,40 +204,73 @@ async def get_performance_trends(
         raise HTTPException(status_code=503, detail="Data analysis service not available")
     
     try:
-        logger.info(f"Analyzing performance trends for period: {time_period}")
-        result = analysis_service.get_performance_trends(time_period)
-        
-        if "error" in result:
-            raise HTTPException(status_code=500, detail=result["error"])
-        
+        # Pass the plain string value downstream: on 3.11 the enum member
+        # formats as "Period.monthly", which would leak into the prompt
+        period = time_period.value
+
+        with _cache_lock:
+            cached = _trends_cache.get(period)
+        if cached is not None:
+            return cached
+
+        logger.info("Analyzing performance trends for period: %s", period)
+        result = analysis_service.get_performance_trends(period)
+
+        with _cache_lock:
+            _trends_cache[period] = result
         return result
         
+    except AnalysisError:
+        raise
     except Exception as e:
-        logger.error(f"Error analyzing performance trends: {e}")
+        logger.error("Error analyzing performance trends: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-# Error handlers
+# Error timestamps only need second granularity, so cache the formatted
+# string per second instead of hitting the clock and formatter per error
+_ts_cache = [0, ""]
+
+def iso_now() -> str:
+    """Return the current ISO timestamp, cached per wall-clock second."""
+    s = int(time.time())
+    if s != _ts_cache[0]:
+        _ts_cache[:] = [s, datetime.fromtimestamp(s).isoformat()]
+    return _ts_cache[1]
+
+# Error handlers (plain dicts through orjson; no Pydantic round-trip)
+@app.exception_handler(AnalysisError)
+async def analysis_error_handler(request, exc: AnalysisError):
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={
+            "error": "Not Found" if exc.status_code == 404 else "Analysis Error",
+            "detail": exc.detail,
+            "timestamp": iso_now()
+        }
+    )
+
+
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
-        content=ErrorResponse(
-            error="Not Found",
-            detail=str(exc.detail) if hasattr(exc, 'detail') else "Resource not found",
-            timestamp=datetime.now().isoformat()
-        ).dict()
+        content={
+            "error": "Not Found",
+            "detail": str(exc.detail) if hasattr(exc, 'detail') else "Resource not found",
+            "timestamp": iso_now()
+        }
     )
 
 @app.exception_handler(500)
 async def server_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
-        content=ErrorResponse(
-            error="Internal Server Error",
-            detail=str(exc.detail) if hasattr(exc, 'detail') else "An unexpected error occurred",
-            timestamp=datetime.now().isoformat()
-        ).dict()
+        content={
+            "error": "Internal Server Error",
+            "detail": str(exc.detail) if hasattr(exc, 'detail') else "An unexpected error occurred",
+            "timestamp": iso_now()
+        }
     )
 
 # Development server
@@ -201,5 +284,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        loop="uvloop",
+        http="httptools"
     )
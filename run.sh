@@ -8,6 +8,6 @@ echo "Starting Sales Performance Analysis API..."
 source venv/bin/activate
 
 # Start the server
-uvicorn main:app --host 0.0.0.0 --port 8000 --reload
+uvicorn main:app --host 0.0.0.0 --port 8000 --reload --loop uvloop --http httptools
 
 echo "Server stopped."
\ No newline at end of file
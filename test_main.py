@@ -0,0 +1,37 @@
+"""Smoke test: the rep_performance endpoint must serialize end to end."""
+import os
+from unittest.mock import patch
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+def test_rep_performance_response_serializes():
+    """A valid rep_id returns 200 JSON with native (non-numpy) scalars."""
+    with patch("llm_service.LLMService._generate", return_value="analysis text"):
+        with TestClient(main.app) as client:
+            assert main.analysis_service is not None
+            rep_id = int(main.analysis_service.data['employee_id'].iloc[0])
+            response = client.get(f"/api/rep_performance?rep_id={rep_id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["employee_id"] == rep_id
+    assert body["llm_analysis"] == "analysis text"
+
+    current = body["performance_metrics"]["current_performance"]
+    assert isinstance(current["conversion_rate"], float)
+    assert isinstance(current["revenue_per_lead"], float)
+    assert isinstance(current["activity_score"], float)
+    assert isinstance(current["pipeline_health"]["pipeline_tours"], int)
+
+
+def test_rep_performance_unknown_id_returns_404():
+    with patch("llm_service.LLMService._generate", return_value="analysis text"):
+        with TestClient(main.app) as client:
+            response = client.get("/api/rep_performance?rep_id=999999999")
+
+    assert response.status_code == 404